@@ -5,113 +5,378 @@
 Проверяет: актуальность, статус операций, переименование
 """
 
-import requests
-import time
+import argparse
+import asyncio
+import csv
+import os
+import aiohttp
+import orjson
 import re
+import unicodedata
+from typing import ClassVar
+from aiohttp_client_cache import CachedSession, SQLiteBackend
+from functools import lru_cache
+from itertools import islice
+from pathlib import Path
 from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.formatting.rule import CellIsRule
 from openpyxl.styles import Font, PatternFill, Alignment
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
 import json
 
-class AirlineChecker:
-    def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        })
-        
-    def check_wikipedia(self, airline_name):
-        """Проверка через Wikipedia API"""
+# Список авиакомпаний для проверки, по одной в строке
+AIRLINES_FILE = Path(__file__).with_name('airlines.txt')
+
+# Вручную проверенные статусы известных авиакомпаний: для них Wikipedia не запрашивается
+KNOWN_STATUS_FILE = Path(__file__).with_name('known_status.json')
+
+# Результаты по мере проверки дописываются сюда; после сбоя запуск продолжается с места остановки
+CHECKPOINT_FILE = Path('airline_checkpoint.jsonl')
+
+WIKI_API_URL = "https://en.wikipedia.org/w/api.php"
+
+# Ответы Wikipedia кэшируются на диске (airline_cache.sqlite)
+CACHE_NAME = 'airline_cache'
+CACHE_EXPIRE_AFTER = timedelta(days=7)
+
+# Одновременно проверяемых пачек, запросов к Wikipedia в секунду
+# и авиакомпаний в пачке (prop=extracts отдает не более 20 статей за запрос)
+CONCURRENCY = 8
+REQUESTS_PER_SECOND = 20
+BATCH_SIZE = 20
+
+# Пауза, если сервер сообщил об исчерпании лимита без Retry-After, секунд
+RATE_LIMIT_PAUSE = 1.0
+
+# Пул соединений: keep-alive вместо нового TLS-рукопожатия на каждый запрос
+POOL_SIZE = 64
+POOL_SIZE_PER_HOST = 8
+KEEPALIVE_TIMEOUT = 60
+
+# Повторы запросов при сбоях соединения и временных ошибках сервера
+RETRY_TOTAL = 3
+RETRY_BACKOFF = 0.3
+RETRY_STATUSES = {429, 502, 503, 504}
+
+# Для анализа статуса достаточно начала вступления статьи
+EXTRACT_CHARS = 1200
+
+# Колонки отчета (XLSX и CSV)
+REPORT_HEADERS = ['№', 'Название авиакомпании', 'Статус', 'Новое название (если переименована)', 
+                  'Уровень уверенности', 'Источник информации']
+
+# Стили отчета создаются один раз и разделяются всеми ячейками
+HEADER_FILL = PatternFill(start_color='4472C4', end_color='4472C4', fill_type='solid')
+HEADER_FONT = Font(bold=True, color='FFFFFF', size=11)
+CENTER = Alignment(horizontal='center', vertical='center', wrap_text=True)
+CELL_ALIGNMENT = Alignment(vertical='center', wrap_text=True)
+CENTER_BOTH = Alignment(horizontal='center', vertical='center')
+
+# Цвета для уровней уверенности
+CONFIDENCE_FILLS = {
+    'ВЫСОКИЙ': PatternFill(start_color='C6EFCE', end_color='C6EFCE', fill_type='solid'),
+    'СРЕДНИЙ': PatternFill(start_color='FFEB9C', end_color='FFEB9C', fill_type='solid'),
+    'НИЗКИЙ': PatternFill(start_color='FFC7CE', end_color='FFC7CE', fill_type='solid')
+}
+
+def load_airlines(path=AIRLINES_FILE):
+    """Загрузка списка авиакомпаний без пустых строк и повторов"""
+    lines = Path(path).read_text(encoding='utf-8').splitlines()
+    return list(dict.fromkeys(line.strip() for line in lines if line.strip()))
+
+def load_known_status(path=KNOWN_STATUS_FILE):
+    """Справочник известных статусов: {ключ названия: запись}"""
+    known = orjson.loads(Path(path).read_bytes())
+    return {canonical_key(name): entry for name, entry in known.items()}
+
+def load_checkpoint(path=CHECKPOINT_FILE):
+    """Результаты из файла промежуточного сохранения: {ключ названия: результат}"""
+    path = Path(path)
+    if not path.exists():
+        return {}
+    
+    results = {}
+    for line in path.read_bytes().splitlines():
         try:
-            # Поиск статьи
-            search_url = "https://en.wikipedia.org/w/api.php"
-            params = {
-                'action': 'opensearch',
-                'search': airline_name,
-                'limit': 5,
-                'format': 'json'
-            }
-            
-            response = self.session.get(search_url, params=params, timeout=10)
-            results = response.json()
-            
-            if len(results) > 1 and len(results[1]) > 0:
-                # Получаем содержимое первой найденной статьи
-                article_title = results[1][0]
-                content_params = {
-                    'action': 'query',
-                    'titles': article_title,
-                    'prop': 'extracts',
-                    'exintro': True,
-                    'explaintext': True,
-                    'format': 'json'
-                }
+            result = orjson.loads(line)
+        except orjson.JSONDecodeError:
+            # Строка, недописанная при аварийном завершении
+            continue
+        if 'error' not in result:
+            results[canonical_key(result['airline'])] = result
+    return results
+
+@lru_cache(maxsize=None)
+def canonical_key(airline_name: str) -> str:
+    """Ключ для сравнения названий без учета регистра, пробелов и формы Unicode"""
+    return unicodedata.normalize('NFKC', airline_name).strip().casefold()
+
+def batched(iterable, n):
+    """Разбиение на кортежи по n элементов (itertools.batched из Python 3.12)"""
+    it = iter(iterable)
+    while batch := tuple(islice(it, n)):
+        yield batch
+
+def _retry_after_seconds(value):
+    """Значение Retry-After (секунды или HTTP-дата) в секундах"""
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    # Дата с зоной -0000 разбирается без tzinfo; по RFC 5322 это UTC
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+class RateLimiter:
+    """Token bucket: не более rate запросов в секунду, с паузой по сигналу сервера"""
+    def __init__(self, rate, capacity=None):
+        self.rate = rate
+        self.capacity = capacity if capacity else rate
+        self._tokens = self.capacity
+        self._updated = None
+        self._paused_until = 0.0
+        self._lock = asyncio.Lock()
+    
+    def pause(self, seconds):
+        """Остановка выдачи токенов на seconds секунд"""
+        loop = asyncio.get_running_loop()
+        self._paused_until = max(self._paused_until, loop.time() + seconds)
+        # Токены начинают пополняться только после паузы, без всплеска запросов
+        self._tokens = 0
+        self._updated = self._paused_until
+    
+    def update(self, headers):
+        """Учет заголовков ответа: Retry-After и X-RateLimit-Remaining"""
+        retry_after = headers.get('Retry-After')
+        if retry_after:
+            seconds = _retry_after_seconds(retry_after)
+            if seconds is not None:
+                self.pause(seconds)
+                return
+        
+        remaining = headers.get('X-RateLimit-Remaining')
+        if remaining is not None and remaining.strip() == '0':
+            self.pause(RATE_LIMIT_PAUSE)
+    
+    async def acquire(self):
+        async with self._lock:
+            loop = asyncio.get_running_loop()
+            while True:
+                now = loop.time()
+                if now < self._paused_until:
+                    await asyncio.sleep(self._paused_until - now)
+                    continue
                 
-                content_response = self.session.get(search_url, params=content_params, timeout=10)
-                content_data = content_response.json()
+                if self._updated is not None:
+                    elapsed = now - self._updated
+                    self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+                self._updated = now
                 
-                pages = content_data.get('query', {}).get('pages', {})
-                if pages:
-                    page = list(pages.values())[0]
-                    extract = page.get('extract', '').lower()
-                    
-                    return {
-                        'found': True,
-                        'title': article_title,
-                        'url': results[2][0] if len(results) > 2 else '',
-                        'extract': extract
-                    }
-            
-            return {'found': False}
-            
-        except Exception as e:
-            print(f"Wikipedia error for {airline_name}: {str(e)}")
-            return {'found': False, 'error': str(e)}
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+def _keywords_re(keywords):
+    """Одно регулярное выражение, находящее любое из ключевых слов"""
+    return re.compile('|'.join(map(re.escape, keywords)))
+
+class AirlineChecker:
+    # Ключевые слова для определения статуса
+    defunct_keywords: ClassVar[tuple] = (
+        'ceased operations', 'defunct', 'no longer operates', 
+        'discontinued', 'liquidated', 'bankrupt', 'shut down',
+        'stopped flying', 'ended operations', 'closed down',
+        'ceased trading', 'went out of business'
+    )
     
-    def analyze_status(self, text, airline_name):
-        """Анализ статуса авиакомпании по тексту"""
-        text_lower = text.lower()
-        airline_lower = airline_name.lower()
+    operating_keywords: ClassVar[tuple] = (
+        'currently operates', 'operating', 'operates flights',
+        'active airline', 'continues to operate', 'flying',
+        'serves destinations', 'scheduled flights', 'is operating'
+    )
+    
+    renamed_keywords: ClassVar[tuple] = (
+        'renamed to', 'rebranded as', 'now known as',
+        'changed its name to', 'became', 'merged with',
+        'acquired by', 'replaced by'
+    )
+    
+    # Выражения компилируются один раз при создании класса
+    # (ClassVar нужен, чтобы модуль корректно собирался mypyc)
+    _defunct_re: ClassVar[re.Pattern] = _keywords_re(defunct_keywords)
+    _operating_re: ClassVar[re.Pattern] = _keywords_re(operating_keywords)
+    _renamed_re: ClassVar[re.Pattern] = _keywords_re(renamed_keywords)
+    _ceased_re: ClassVar[re.Pattern] = re.compile(r'ceased operations?.*?(\d{4})')
+    _rename_re: ClassVar[re.Pattern] = re.compile(
+        f'(?:{"|".join(map(re.escape, renamed_keywords))})'
+        r'\s+([A-Z][\w\s&-]+?)(?:\.|,|\sin\s|\sfrom\s|$)',
+        re.IGNORECASE
+    )
+    
+    def __init__(self):
+        self.session = None
+        self.rate_limiter = RateLimiter(REQUESTS_PER_SECOND)
+        self._known = load_known_status()
+        self.headers = {
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+            'Accept-Encoding': 'gzip, deflate'
+        }
+    
+    def _get_session(self):
+        """Ленивое создание HTTP-сессии (нужен запущенный event loop)"""
+        if self.session is None:
+            self.session = CachedSession(
+                cache=SQLiteBackend(CACHE_NAME, expire_after=CACHE_EXPIRE_AFTER),
+                headers=self.headers,
+                connector=aiohttp.TCPConnector(
+                    limit=POOL_SIZE,
+                    limit_per_host=POOL_SIZE_PER_HOST,
+                    keepalive_timeout=KEEPALIVE_TIMEOUT
+                )
+            )
+        return self.session
+    
+    async def clear_cache(self):
+        """Удаление всех сохраненных ответов Wikipedia"""
+        await self._get_session().cache.clear()
+    
+    async def close(self):
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+    
+    async def _get_json(self, url, params):
+        """GET-запрос к API с учетом ограничения частоты и повторами при сбоях"""
+        session = self._get_session()
+        # Свежие ответы из кэша не расходуют лимит запросов; get_response
+        # учитывает срок хранения и удаляет устаревшие записи
+        cache_key = session.cache.create_key('GET', url, params=params)
+        cached = await session.cache.get_response(cache_key) is not None
         
-        # Ключевые слова для определения статуса
-        defunct_keywords = [
-            'ceased operations', 'defunct', 'no longer operates', 
-            'discontinued', 'liquidated', 'bankrupt', 'shut down',
-            'stopped flying', 'ended operations', 'closed down',
-            'ceased trading', 'went out of business'
-        ]
+        for attempt in range(RETRY_TOTAL + 1):
+            if not cached:
+                await self.rate_limiter.acquire()
+            try:
+                async with session.get(url, params=params, timeout=aiohttp.ClientTimeout(total=10)) as response:
+                    # Заголовки ограничения частоты учитываются только у ответов сервера
+                    if not response.from_cache:
+                        self.rate_limiter.update(response.headers)
+                    if response.status not in RETRY_STATUSES or attempt == RETRY_TOTAL:
+                        response.raise_for_status()
+                        return orjson.loads(await response.read())
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                if attempt == RETRY_TOTAL:
+                    raise
+            await asyncio.sleep(RETRY_BACKOFF * 2 ** attempt)
+    
+    async def search_wikipedia(self, airline_name):
+        """Поиск статьи через opensearch: (название статьи, url) или None"""
+        params = {
+            'action': 'opensearch',
+            'search': airline_name,
+            'limit': 1,
+            'format': 'json'
+        }
+        results = await self._get_json(WIKI_API_URL, params)
         
-        operating_keywords = [
-            'currently operates', 'operating', 'operates flights',
-            'active airline', 'continues to operate', 'flying',
-            'serves destinations', 'scheduled flights', 'is operating'
-        ]
+        # Ответ: [запрос, [названия], [описания], [ссылки]]
+        if len(results) > 1 and len(results[1]) > 0:
+            return results[1][0], results[3][0] if len(results) > 3 and results[3] else ''
+        return None
+    
+    async def fetch_extracts(self, titles):
+        """Вступления статей одним запросом: {название статьи: текст}"""
+        content_params = {
+            'action': 'query',
+            'titles': '|'.join(titles),
+            'prop': 'extracts',
+            'exintro': 1,
+            'explaintext': 1,
+            'exchars': EXTRACT_CHARS,
+            'exlimit': 'max',
+            'redirects': 1,
+            'format': 'json',
+            'formatversion': 2
+        }
+        content_data = await self._get_json(WIKI_API_URL, content_params)
+        query = content_data.get('query', {})
         
-        renamed_keywords = [
-            'renamed to', 'rebranded as', 'now known as',
-            'changed its name to', 'became', 'merged with',
-            'acquired by', 'replaced by'
-        ]
+        extracts = {
+            page['title']: page.get('extract', '')
+            for page in query.get('pages', [])
+            if not page.get('missing')
+        }
+        # API может нормализовать запрошенные названия и пройти по перенаправлениям
+        for item in query.get('redirects', []) + query.get('normalized', []):
+            if item['to'] in extracts:
+                extracts[item['from']] = extracts[item['to']]
+        return extracts
+    
+    async def fetch_batch(self, names):
+        """Проверка пачки авиакомпаний через Wikipedia API: {название: результат}"""
+        searches = await asyncio.gather(
+            *[self.search_wikipedia(name) for name in names],
+            return_exceptions=True
+        )
+        
+        titles = list(dict.fromkeys(s[0] for s in searches if isinstance(s, tuple)))
+        extracts = {}
+        batch_error = None
+        if titles:
+            try:
+                extracts = await self.fetch_extracts(titles)
+            except Exception as e:
+                print(f"Wikipedia error for batch {names[0]}..{names[-1]}: {str(e)}")
+                batch_error = str(e)
+        
+        wiki_results = {}
+        for name, search in zip(names, searches):
+            if isinstance(search, Exception):
+                print(f"Wikipedia error for {name}: {str(search)}")
+                wiki_results[name] = {'found': False, 'error': str(search)}
+            elif search and search[0] in extracts:
+                title, url = search
+                wiki_results[name] = {
+                    'found': True,
+                    'title': title,
+                    'url': url,
+                    'extract': extracts[title]
+                }
+            elif search and batch_error:
+                wiki_results[name] = {'found': False, 'error': batch_error}
+            else:
+                wiki_results[name] = {'found': False}
+        return wiki_results
+    
+    def analyze_status(self, text: str, airline_name: str) -> dict:
+        """Анализ статуса авиакомпании по тексту"""
+        # Текст приходит в исходном регистре: нижний регистр строится один раз
+        # для поиска ключевых слов, исходный нужен для нового названия
+        text_lower = text.lower()
         
         # Проверка статуса
-        is_defunct = any(keyword in text_lower for keyword in defunct_keywords)
-        is_operating = any(keyword in text_lower for keyword in operating_keywords)
-        is_renamed = any(keyword in text_lower for keyword in renamed_keywords)
+        is_defunct = self._defunct_re.search(text_lower) is not None
+        is_operating = self._operating_re.search(text_lower) is not None
+        is_renamed = self._renamed_re.search(text_lower) is not None
         
         # Поиск даты прекращения операций
-        ceased_date_pattern = r'ceased operations?.*?(\d{4})'
-        ceased_match = re.search(ceased_date_pattern, text_lower)
+        ceased_match = self._ceased_re.search(text_lower)
         ceased_year = ceased_match.group(1) if ceased_match else None
         
         # Поиск нового названия
         new_name = None
         if is_renamed:
-            for keyword in renamed_keywords:
-                pattern = f'{keyword}\\s+([A-Z][\\w\\s&-]+?)(?:\\.|,|\\sin\\s|\\sfrom\\s|$)'
-                match = re.search(pattern, text, re.IGNORECASE)
-                if match:
-                    new_name = match.group(1).strip()
-                    break
+            match = self._rename_re.search(text)
+            new_name = match.group(1).strip() if match else None
         
         # Определение уровня уверенности
         confidence = 'НИЗКИЙ'
@@ -139,21 +404,20 @@ class AirlineChecker:
             'ceased_year': ceased_year
         }
     
-    def check_airline(self, airline_name):
-        """Комплексная проверка авиакомпании"""
-        print(f"Проверка: {airline_name}")
-        
-        # Проверка Wikipedia
-        wiki_result = self.check_wikipedia(airline_name)
-        
+    def check_airline(self, airline_name: str, wiki_result: dict) -> dict:
+        """Комплексная проверка авиакомпании по результату Wikipedia"""
         if not wiki_result.get('found'):
-            return {
+            result = {
                 'airline': airline_name,
                 'status': 'ИНФОРМАЦИЯ НЕ НАЙДЕНА',
                 'new_name': 'Н/Д',
                 'confidence': 'НИЗКИЙ',
                 'source': 'Информация не найдена в доступных источниках'
             }
+            # Сбой запроса, а не отсутствие статьи: при продолжении проверить заново
+            if 'error' in wiki_result:
+                result['error'] = wiki_result['error']
+            return result
         
         # Анализ найденной информации
         analysis = self.analyze_status(wiki_result['extract'], airline_name)
@@ -166,62 +430,95 @@ class AirlineChecker:
             'source': f"Wikipedia: {wiki_result['url']}"
         }
     
-    def create_excel_report(self, results, filename='airline_status_report.xlsx'):
-        """Создание Excel отчета"""
-        wb = Workbook()
-        ws = wb.active
-        ws.title = "Статус авиакомпаний"
-        
-        # Заголовки
-        headers = ['№', 'Название авиакомпании', 'Статус', 'Новое название (если переименована)', 
-                   'Уровень уверенности', 'Источник информации']
+    def check_known(self, airline_name):
+        """Результат из справочника известных статусов или None"""
+        known = self._known.get(canonical_key(airline_name))
+        if known is None:
+            return None
         
-        # Стили для заголовков
-        header_fill = PatternFill(start_color='4472C4', end_color='4472C4', fill_type='solid')
-        header_font = Font(bold=True, color='FFFFFF', size=11)
+        status = known['status']
+        if status == 'НЕ ДЕЙСТВУЕТ':
+            status = f'НЕ ДЕЙСТВУЕТ (прекращена {known.get("ceased_year") or "дата неизвестна"})'
         
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(row=1, column=col, value=header)
-            cell.fill = header_fill
-            cell.font = header_font
-            cell.alignment = Alignment(horizontal='center', vertical='center', wrap_text=True)
+        return {
+            'airline': airline_name,
+            'status': status,
+            'new_name': known.get('new_name', 'Н/Д'),
+            'confidence': 'ВЫСОКИЙ',
+            'source': f'Проверено вручную ({KNOWN_STATUS_FILE.name})'
+        }
+    
+    async def check_batch(self, names):
+        """Проверка пачки авиакомпаний"""
+        # Авиакомпании из справочника не требуют запросов к Wikipedia
+        known_results = {name: self.check_known(name) for name in names}
+        unknown = [name for name, result in known_results.items() if result is None]
+        wiki_results = await self.fetch_batch(unknown) if unknown else {}
+        return [known_results[name] or self.check_airline(name, wiki_results[name]) for name in names]
+    
+    def write_csv_report(self, results, filename='airline_status_report.csv'):
+        """Сохранение результатов в CSV одним проходом, без оформления"""
+        # Запись во временный файл и замена: файл отчета всегда целый
+        tmp_filename = f'{filename}.tmp'
+        with open(tmp_filename, 'w', newline='', encoding='utf-8-sig') as f:
+            writer = csv.writer(f)
+            writer.writerow(REPORT_HEADERS)
+            writer.writerows(
+                [idx, r['airline'], r['status'], r['new_name'], r['confidence'], r['source']]
+                for idx, r in enumerate(results, 1)
+            )
+        os.replace(tmp_filename, filename)
+        print(f"\nОтчет сохранен: {filename}")
+        return filename
+    
+    def create_excel_report(self, results, filename='airline_status_report.xlsx'):
+        """Создание Excel отчета"""
+        # write_only: строки пишутся в файл потоком, лист не хранится в памяти
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet("Статус авиакомпаний")
         
-        # Ширина колонок
+        # Ширина колонок и закрепление первой строки задаются до записи строк
         ws.column_dimensions['A'].width = 5
         ws.column_dimensions['B'].width = 35
         ws.column_dimensions['C'].width = 30
         ws.column_dimensions['D'].width = 35
         ws.column_dimensions['E'].width = 18
         ws.column_dimensions['F'].width = 50
+        ws.freeze_panes = 'A2'
         
-        # Цвета для уровней уверенности
-        confidence_colors = {
-            'ВЫСОКИЙ': PatternFill(start_color='C6EFCE', end_color='C6EFCE', fill_type='solid'),
-            'СРЕДНИЙ': PatternFill(start_color='FFEB9C', end_color='FFEB9C', fill_type='solid'),
-            'НИЗКИЙ': PatternFill(start_color='FFC7CE', end_color='FFC7CE', fill_type='solid')
-        }
+        # Заголовки
+        header_cells = []
+        for header in REPORT_HEADERS:
+            cell = WriteOnlyCell(ws, value=header)
+            cell.fill = HEADER_FILL
+            cell.font = HEADER_FONT
+            cell.alignment = CENTER
+            header_cells.append(cell)
+        ws.append(header_cells)
         
         # Заполнение данных
-        for idx, result in enumerate(results, 2):
-            ws.cell(row=idx, column=1, value=idx-1)
-            ws.cell(row=idx, column=2, value=result['airline'])
-            ws.cell(row=idx, column=3, value=result['status'])
-            ws.cell(row=idx, column=4, value=result['new_name'])
+        for idx, result in enumerate(results, 1):
+            values = [idx, result['airline'], result['status'], result['new_name'],
+                      result['confidence'], result['source']]
+            row_cells = []
+            for value in values:
+                cell = WriteOnlyCell(ws, value=value)
+                cell.alignment = CELL_ALIGNMENT
+                row_cells.append(cell)
             
             # Ячейка с уровнем уверенности
-            confidence_cell = ws.cell(row=idx, column=5, value=result['confidence'])
-            if result['confidence'] in confidence_colors:
-                confidence_cell.fill = confidence_colors[result['confidence']]
-            confidence_cell.alignment = Alignment(horizontal='center', vertical='center')
-            
-            ws.cell(row=idx, column=6, value=result['source'])
-            
-            # Выравнивание
-            for col in range(1, 7):
-                ws.cell(row=idx, column=col).alignment = Alignment(vertical='center', wrap_text=True)
+            row_cells[4].alignment = CENTER_BOTH
+            ws.append(row_cells)
         
-        # Закрепление первой строки
-        ws.freeze_panes = 'A2'
+        # Цвет уровня уверенности задается тремя правилами условного
+        # форматирования на всю колонку, а не заливкой каждой ячейки
+        if results:
+            confidence_range = f'E2:E{len(results) + 1}'
+            for confidence, fill in CONFIDENCE_FILLS.items():
+                ws.conditional_formatting.add(
+                    confidence_range,
+                    CellIsRule(operator='equal', formula=[f'"{confidence}"'], fill=fill)
+                )
         
         # Добавление информационного листа
         info_ws = wb.create_sheet('Информация')
@@ -242,1235 +539,99 @@ class AirlineChecker:
             ['ИНФОРМАЦИЯ НЕ НАЙДЕНА', 'Не удалось найти информацию в доступных источниках']
         ]
         
-        for row_idx, row_data in enumerate(info_data, 1):
-            for col_idx, value in enumerate(row_data, 1):
-                info_ws.cell(row=row_idx, column=col_idx, value=value)
-        
         info_ws.column_dimensions['A'].width = 30
         info_ws.column_dimensions['B'].width = 80
         
+        for row_data in info_data:
+            info_ws.append(row_data)
+        
         wb.save(filename)
         print(f"\nОтчет сохранен: {filename}")
         return filename
 
+async def check_all(checker, airlines_list, refresh=False, checkpoint=CHECKPOINT_FILE):
+    """Параллельная проверка списка авиакомпаний пачками по BATCH_SIZE"""
+    # Совпадающие после нормализации названия проверяются один раз
+    canonical = {}
+    for airline in airlines_list:
+        canonical.setdefault(canonical_key(airline), airline)
+    unique_airlines = list(canonical.values())
+    if len(unique_airlines) < len(airlines_list):
+        print(f"Повторяющихся названий: {len(airlines_list) - len(unique_airlines)}\n")
+    
+    # Продолжение прерванного запуска
+    checkpoint = Path(checkpoint)
+    if refresh:
+        checkpoint.unlink(missing_ok=True)
+    checked = load_checkpoint(checkpoint)
+    done = [checked[key] for key in canonical if key in checked]
+    pending = [airline for key, airline in canonical.items() if key not in checked]
+    if done:
+        print(f"Продолжение с промежуточного сохранения: {len(done)} уже проверено\n")
+    
+    sem = asyncio.Semaphore(CONCURRENCY)
+    
+    async def _bounded(batch):
+        async with sem:
+            return await checker.check_batch(batch)
+    
+    try:
+        if refresh:
+            await checker.clear_cache()
+        
+        # Пачки обрабатываются по мере завершения, а не в порядке списка;
+        # каждый результат сразу дописывается в файл промежуточного сохранения
+        tasks = [_bounded(b) for b in batched(pending, BATCH_SIZE)]
+        with checkpoint.open('ab') as checkpoint_file:
+            # Недописанная при сбое строка не должна склеиться со следующей
+            if checkpoint_file.tell() > 0:
+                checkpoint_file.write(b'\n')
+            for future in asyncio.as_completed(tasks):
+                for result in await future:
+                    done.append(result)
+                    if 'error' not in result:
+                        checkpoint_file.write(orjson.dumps(result) + b'\n')
+                    print(f"[{len(done)}/{len(unique_airlines)}] {result['airline']}: {result['status']}")
+                checkpoint_file.flush()
+    finally:
+        await checker.close()
+    
+    # Результаты возвращаются в порядке исходного списка, для каждого написания
+    by_key = {canonical_key(r['airline']): r for r in done}
+    return [dict(by_key[canonical_key(airline)], airline=airline) for airline in airlines_list]
+
 def main():
-    # Список авиакомпаний
-    airlines = """Aegean Airlines
-Aer Lingus
-Aereonautica militare
-Aero Contractors
-Aero Lanka
-Aero VIP (2D)
-Aero-Service
-Aeroflot Russian Airlines
-Aerolane
-Aeroline GmbH
-Aerolineas Africanas
-Aerolineas Argentinas
-Aerolineas Galapagos (Aerogal)
-Aerolineas heredas santa maria
-Aerolitoral
-Aeromar
-AeroMéxico
-Aeronautica Militare
-Aeronorte
-Aeropelican Air Services
-AeroRep
-Aerosur
-AeroWorld 
-Africa West
-Afriqiyah Airways
-Air 26
-Air Afrique
-Air Alfa
-Air Algerie
-Air Alps Aviation (A6)
-Air Antilles Express
-Air Arabia
-Air Arabia Egypt
-Air Arabia Maroc
-Air Astana
-Air Atlanta Icelandic
-Air Austral
-Air Bagan
-Air Baltic
-Air Bangladesh
-Air Batumi
-Air Botswana
-Air Bucharest
-Air Burkina
-Air Busan
-Air Caledonie International
-Air Canada
-Air Canada Jazz
-Air Caraïbes
-Air Cargo Carriers
-Air Cargo Germany
-Air Carnival
-Air Century
-Air Chathams
-Air China
-Air Choice One
-Air Comet Chile
-Air Costa
-Air Cudlua
-Air Dolomiti
-Air Europa
-Air Exel
-Air Explore
-Air Finland
-Air Florida
-Air Foyle
-Air France
-Air Glaciers
-Air Greenland
-Air Guinee Express
-Air Guyane
-Air Hamburg (AHO)
-Air Iceland
-Air India Express
-Air India Limited
-Air India Regional
-AIR INDOCHINE
-Air Indus
-Air Italy Egypt
-Air Ivoire
-Air Japan
-Air Kazakhstan
-Air KBZ
-Air Kenya (Priv)
-Air Kiribati
-Air Koryo
-Air Lituanica
-Air Luxor
-Air Macau
-Air Madagascar
-Air Madrid
-Air Majoro
-Air Malta
-Air Mandalay
-Air Marshall Islands
-Air Mauritius
-Air Mediterranee
-Air Mekong
-Air Moldova
-Air Moorea
-Air Mozambique
-Air New Zealand
-Air Niugini
-Air North Charter - Canada
-Air Nostrum
-Air Pacific
-Air Pegasus
-Air Philippines
-Air Plus Comet
-Air Rarotonga
-Air Saint Pierre
-Air Serbia
-Air Seychelles
-Air Sinai
-Air Sunshine
-Air Tahiti
-Air Tahiti Nui
-Air Tanzania
-Air Tindi
-Air Transat
-Air Vanuatu
-Air VIA
-Air Vistara
-Air Volga
-Air Wales
-Air Wisconsin
-Air Zimbabwe
-Air2there
-AirAsia
-AirAsia Japan
-AirAsia X
-Airblue
-Aircompany Yakutia
-Aires
-Airfix Aviation
-Airlift International
-Airlinair
-Airlines PNG
-Airlink (SAA)
-Airnorth
-AirOnix
-AirRussia
-AirTran Airways
-Akasa Air
-Al-Naser Airlines
-ALAK
-Alaska Airlines
-Alaska Seaplane Service
-Albanian Airlines
-AlbaStar
-Alghanim
-Alitalia
-All Africa
-All America
-All America AR
-All America BOPY
-All America BR
-All America CL
-All America CO
-All America MX
-All America US
-All Argentina
-All Argentina Express
-All Asia
-All Australia
-All Colombia
-All Europe
-All Nippon Airways
-All Spain
-Allegiant Air
-Alliance Airlines
-AlMasria Universal Airlines
-Alrosa Mirny Air Enterprise
-Amaszonas
-American Airlines
-American Eagle Airlines
-Amsterdam Airlines
-ANA Wings
-Andalus Lineas Aereas
-Apache Air
-Ariana Afghan Airlines
-Arik Niger
-Arkefly
-Arkia Israel Airlines
-Armavia
-Arrow Air
-Aruba Airlines
-Aserca Airlines
-Asia Wings
-Asian Spirit
-Asian Wings Airways
-Asiana Airlines
-Askari Aviation
-Astair
-Astral Aviation
-Athens Airways
-Atifly
-Atlant-Soyuz Airlines
-Atlantic Airways
-Atlantis European Airways
-Atlas Air
-AtlasGlobal Ukraine
-Atlasjet
-ATRAN Cargo Airlines
-Aurigny Air Services
-Austral Brasil
-Austral Lineas Aereas
-Austrian Airlines
-Aviabus
-Avialeasing Aviation Company
-Avianca
-Avianca - Aerovias Nacionales de Colombia
-Avianova (Russia)
-Avient Aviation
-Avilu
-Aws express
-Azerbaijan Airlines
-Azul
-BA CityFlyer
-BA101
-Bahamasair
-Baikotovitchestrian Airlines 
-Balkan Bulgarian Airlines
-Baltic Air lines
-Baltic Airlines
-Bamboo Airways
-Bangkok Airways
-Barents AirLink
-Bassaka airlines
-Bateleur Air
-Batik Air
-BBN-Airways
-Bearskin Lake Air Service
-Belair Airlines
-Belavia Belarusian Airlines
-Bellview Airlines
-Bemidji Airlines
-Bering Air
-Berjaya Air
-BF-Lento OY
-Biman Bangladesh Airlines
-Bingo Airways
-Binter Canarias
-Black Stallion Airways
-Blue Air
-Blue Panorama Airlines
-Blue Wings
-Blue1
-Bluebird Airways (BZ)
-bmi
-bmibaby
-Bobb Air Freight
-Boliviana de Aviacion (OB)
-Boutique Air (Priv)
-BQB Lineas Aereas
-BRAZIL AIR
-Brazilian Air Force
-Breeze Airways
-Brit Air
-British Airways
-British International Helicopters
-British Mediterranean Airways
-British Midland Regional
-Brussels Airlines
-Budapest Aircraft Services/Manx2
-BudgetAir
-Bulgaria Air
-Buquebus Líneas Aéreas
-Business Aviation
-BusinessAir
-BVI Airways
-CAL Cargo Air Lines
-Calima Aviacion
-Camair-co
-Cambodia Angkor Air (K6)
-Canadian Airlines
-Canadian National Airways
-Canadian North
-Canaryfly
-CanXplorer
-CanXpress
-Cape Air
-Cargo Plus Aviation
-Caribbean Airlines
-CARICOM AIRWAYS (BARBADOS) INC.
-Carnival Air Lines
-Carpatair
-Carpatair Flight Training
-Caspian Airlines
-Cathay Pacific
-Catovair
-Caucasus Airlines
-Cayman Airways
-CB Airways UK ( Interliging Flights )
-CBM America
-CCML Airlines
-Cebu Pacific
-CEIBA Intercontinental
-Cello Aviation
-Central Connect Airlines
-Centralwings
-Charter Air
-Chautauqua Airlines
-China Airlines
-China Eastern Airlines
-China Northwest Airlines (WH)
-China Southern Airlines
-China SSS
-China United Airlines
-Choice Airways
-Chongqing Airlines
-Ciao Air
-Ciel Canadien
-Cimber Air
-Cirrus Airlines
-Citilink Indonesia
-City Airline
-City Airways
-City Connexion Airlines
-CityJet
-Click (Mexicana)
-Click Airways
-Coastal Air
-COBALT
-Colgan Air
-Comair
-Comfort Express Virtual Charters
-Comfort Express Virtual Charters Albany
-CommutAir
-Comores Airlines
-Compagnie Africaine d\\'Aviation
-Compass Airlines
-Comtel Air
-Condor Flugdienst
-Congo Express
-ConneX European Airline
-Consorcio Aviaxsa
-Contact Air
-Continental Airlines
-Continental Express
-Continental Micronesia
-Conviasa
-Copa Airlines
-Copenhagen Express
-Copterline
-Corendon Airlines
-Corsairfly
-Corse-Mediterranee
-Crest Aviation
-Croatia Airlines
-Crown Airways
-Cubana de Aviación
-Cyprus Airways
-Cyprus Turkish Airlines
-Czech Airlines
-Daallo Airlines
-Dalavia
-Dana Air
-Danube Wings (V5)
-Darwin Airline
-DAT Danish Air Transport
-dba
-Delta Aerotaxi
-Delta Air Lines
-Denim Air
-Dennis Sky
-Dense Airways
-Dense Connection
-Deutsche Bahn
-Direct Aero Services
-Djibouti Airlines
-Dniproavia
-Dobrolet
-Domenican Airlines
-Dominicana de Aviaci
-Domodedovo Airlines
-DonbassAero
-Dragonair
-Druk Air
-Dubrovnik Air
-Dutch Antilles Express
-Dynamic Airways
-Eagle Air
-Eagle Atlantic Airlines
-Eagles Airlines
-East African
-East Horizon
-Eastar Jet
-Eastern Airways
-Eastern Atlantic Virtual Airlines
-Eastland Air
-Eastok Avia
-EasyFly
-easyJet
-EasyJet (DS)
-Ecuavia
-Edelweiss Air
-Egyptair
-EgyptAir Express
-El Al Israel Airlines
-El-Buraq Air Transport
-ELK Airways
-Elysian Airlines
-Emirates
-Empresa Ecuatoriana De Aviacion
-Enerjet
-ENTERair
-Envoy Air
-Epic Holiday
-Era Alaska
-Eritrean Airlines
-Estonian Air
-Ethiopian Airlines
-Etihad Airways
-Euro Exec Express
-Euro Jet
-Eurocypria Airlines
-Eurofly Service
-Euroline
-Eurolot
-Europe Jet
-European Air Express
-EuropeSky
-Eurowings
-EVA Air
-Evergreen International Airlines
-Excel Airways
-Excel Charter
-Executive AirShare
-Express One International
-ExpressJet
-Eznis Airways
-Far Eastern Air Transport
-Fars Air Qeshm
-Feeder Airlines
-Felix Airways
-Finlandian
-Finnair
-Finncomm Airlines
-Firefly
-First Air
-First Choice Airways
-First Flying
-Flightline
-Flightlink Tanzania
-Florida West International Airways
-Flugfelag Vestmannaeyja
-Fly 6ix
-Fly Africa Zimbabwe
-Fly Brasil
-Fly Colombia ( Interliging Flights )
-Fly Dubai
-Fly Europa
-Fly France
-Fly Jamaica Airways
-Fly One
-Fly Romania
-Fly540
-Flybaboo
-Flybe
-Flybe Finland Oy
-FlyEgypt
-Flyglobespan
-FlyHigh Airlines Ireland (FH)
-Flyhy Cargo Airlines
-Flying kangaroo Airline
-FLYJET
-FlyLal
-FlyLAL Charters
-Flyme (VP)
-FlyNordic
-FlyPortugal
-Formosa Airlines
-FOX Linhas Aereas
-Freedom Air
-Frontier Airlines
-Frontier Flying Service
-Fuji Dream Airlines
-Fuzhou Airlines
-Gabon Airlines
-Gadair European Airlines
-Garuda Indonesia
-Gazpromavia
-GB Airways
-Genesis
-Georgian Airways
-Georgian International Airlines
-Georgian National Airlines
-German Air Force - FLB
-German International Air Lines
-Germania
-Germanwings
-GermanXL
-Ghana International Airlines
-Global Airlines
-Globus
-GNB Linhas Aereas
-Go Air
-Go First
-Go2Sky
-GoJet Airlines
-Gol Transportes Aéreos
-Golden Air
-Golden Myanmar Airlines
-Gomelavia
-Grand China Air
-Grand Cru Airlines
-Grant Aviation
-Great Lakes Airlines
-Greenfly
-Grupo TACA
-Gryphon Airlines
-Gulf Air
-Gulf Air Bahrain
-Gulfstream International Airlines
-GX Airlines
-Hageland Aviation Services
-Hainan Airlines
-Haiti Ambassador Airlines
-Halcyonair
-Hamburg Airways
-Hamburg International
-Hankook Air US
-Hankook Airline
-Hapagfly
-Happy Air
-Harbour Air (Priv)
-Hawaiian Airlines
-Hawkair
-Hebei Airlines
-Hebradran Air Services
-Heli France
-Helijet
-Helitt Líneas Aéreas
-Hellas Jet
-Hellenic Imperial Airways
-Hello
-Helvetic Airways
-Hermes Airlines
-Hex'Air
-Hi Fly (5K)
-Highland Airways
-Himalayan Airlines
-Hokkaido International Airlines
-Holidays Czech Airlines
-Homer Air
-Hong Kong Airlines
-Hong Kong Express Airways
-Horizon Air
-Huaxia
-I-Fly
-Iberia Airlines
-Iberia Express
-Iberworld
-Ibex Airlines
-Icar Air
-Icelandair
-Imair Airlines
-INAVIA Internacional
-Indian Airlines
-IndiGo Airlines
-Indochina Airlines
-Indonesa Air Aisa X
-Indonesia AirAsia
-Indonesia Sky
-Indonesian Airlines
-Indya Airline Group
-Insel Air (7I/INC) (Priv)
-Interair South Africa
-Interavia Airlines
-Interjet (ABC Aerolineas)
-Interlink Airlines
-International AirLink
-International Europe
-Intersky
-Iran Air
-Iran Aseman Airlines
-Iraqi Airways
-Island Air (WP)
-Island Airlines
-Island Express Air
-Island Spirit
-Islas Airways
-Islena De Inversiones
-Israir
-ITA Airways
-Itek Air
-IzAvia
-Jagson Airlines
-JAL Express
-JALways
-Japan Air System
-Japan Airlines
-Japan Airlines Domestic
-Japan Asia Airways
-Japan Regio
-Japan Transocean Air
-Jayrow
-Jazeera Airways
-Jc royal.britannica
-Jeju Air
-Jet Airways
-Jet Suite
-Jet2.com
-Jet4You
-Jetairfly
-JetBlue Airways
-Jetflite
-Jetgo Australia
-Jetstar Airways
-Jetstar Asia Airways
-Jetstar Japan 
-Jetstar Pacific
-Jettor Airlines
-Jin Air
-JobAir
-Jota Aviation
-Joy Air
-Juneyao Airlines
-Jupiter Airlines
-Jusur airways
-Kal Star Aviation
-Kam Air
-Kan Air
-Kavminvodyavia
-KD Avia
-Kendell Airlines
-Kenmore Air
-Kenya Airways
-Kharkiv Airlines
-Kingfisher Airlines
-Kinloss Flying Training Unit
-Kish Air
-KLM Cityhopper
-KLM Royal Dutch Airlines
-KMV
-Kogalymavia Air Company
-KoralBlue Airlines
-Korea Express Air
-Korean Air
-Korongo Airlines
-Kosmos
-Kostromskie avialinii
-Krasnojarsky Airlines
-KSY
-Kuban Airlines
-Kush Air
-Kuwait Airways
-Kuzu Airlines Cargo
-L
-LACSA
-LAN Airlines
-LAN Argentina
-LAN Express
-LAN Peru
-Lao Airlines
-LatCharter
-Lauda Air
-LCM AIRLINES
-Leeward Islands Air Transport
-Liberty Airways
-Libyan Arab Airlines
-Line Blue
-Linhas A
-Lion Mentari Airlines
-LionXpress
-Locair
-LOT Polish Airlines
-LSM Airlines
-LSM International 
-LTE International Airways
-LTU Austria
-Luchsh Airlines 
-Luftfahrtgesellschaft Walter
-Lufthansa
-Lufthansa Cargo
-Lufthansa CityLine
-Lufttransport
-Lugansk Airlines
-Luxair
-Maastricht Airlines
-Macair Airlines
-Maersk
-Mahan Air
-Malawian Airlines
-Malaysia Airlines
-Malaysia Wings
-Maldivian
-Maldivian Air Taxi
-Maldivo Airlines
-Malindo Air
-Malmo Aviation
-Malmö Aviation
-Malta Air Charter
-Malév
-Mandala Airlines
-Mandarin Airlines
-Mango
-Mann Yadanarpon Airlines
-Martinair
-Marusya Airways
-Maryland Air
-Marysya Airlines
-MasAir
-MAT Airways
-MAT Macedonian Airlines
-Mauritania Airlines International
-Mauritania Airways
-Maxair
-Maya Island Air
-MCA Airlines
-MDLR Airlines
-Med Airways
-Medallion Air
-Meridiana
-Merpati Nusantara Airlines
-Mesa Airlines
-Mesaba Airlines
-Metro Batavia
-Mexicana de Aviaci
-MexicanaLink
-MHS Aviation GmbH
-MIAT Mongolian Airlines
-Michael Airlines
-Middle East Airlines
-Midway Airlines
-Midwest Airlines
-Midwest Airlines (Egypt)
-Mint Airways
-MNG Airlines
-Moldavian Airlines
-Monarch Airlines
-Mongolian International Air Lines 
-Montenegro Airlines
-Morningstar Air Express
-Moskovia Airlines
-Motor Sich
-Myanma Airways
-Myanmar Airways International
-Myflug
-MyTravel Airways
-Myway Airlines
-N1
-Nas Air
-Nasair
-National Air Cargo
-National Jet Systems
-Nationwide Airlines
-Nauru Air Corporation
-Nepal Airlines
-Nesma Airlines
-NetJets
-New England Airlines
-NEXT Brasil
-NextJet
-Nihon.jet connect
-Niki
-Nile Air
-Nok Air
-Nordic Global Airlines
-Nordica
-NordStar Airlines
-Norfolk County Flight College
-Norlandair
-Norte Lineas Aereas
-North American Airlines
-North American Charters
-Northern Dene Airways
-Northwest Airlines
-Northwestern Air
-Norwegian Air International (D8)
-Norwegian Air Shuttle
-Norwegian Aviation College
-Norwegian Long Haul AS
-Nouvel Air Tunisie
-Novair
-Oasis Hong Kong Airlines
-Ocean Air
-OCEAN AIR CARGO
-Oceanair
-Oceanic Airlines
-Olympic Airlines
-Oman Air
-Omni Air International
-One Two Go Airlines
-OneChina
-OneJet
-Onur Air
-Orbest
-Orbit Airlines
-Orbit Airlines Azerbaijan
-Orbit Atlantic Airways
-Orbit International Airlines
-Orbit Regional Airlines
-Orchid Airlines
-Orenburg Airlines
-Orenburzhie
-Orient Thai Airlines
-Origin Pacific Airways
-Ostfriesische Lufttransport
-Overland Airways
-Ozjet Airlines
-Pacific Coastal Airline
-Pacific East Asia Cargo Airlines
-Pacific Flier
-Pacific Island Aviation
-Pacific Wings
-Pakistan International Airlines
-Pal airlines
-PAN Air
-Pan Am World Airways Dominicana
-PanAm World Airways
-Papillon Grand Canyon Helicopters
-Paramount Airways
-Parmiss Airlines (IPV)
-Passaredo Transportes Aereos
-Patriot Airways
-PB Air
-Peach Aviation
-Pegasus Airlines
-PEGASUS AIRLINES-
-Pelita
-Peninsula Airways
-Peruvian Airlines
-Philippine Airlines
-Piedmont Airlines (1948-1989)
-Pinnacle Airlines
-PLUNA
-PMTair
-Pobeda
-Polar Airlines
-Polet
-Polet Airlines (Priv)
-Polynesian Airlines
-Porter Airlines
-Portugalia
-Potomac Air
-Pouya Air
-Precision Air
-Primera Air
-Privatair
-Proflight Commuter Services
-Qantas
-Qatar Airways
-QatXpress
-RACSA
-Rainbow Air (RAI)
-Rainbow Air Canada
-Rainbow Air Euro
-Rainbow Air Polynesia
-Rainbow Air US
-Real Tonga
-Red Jet Andes
-Red Jet Canada
-Red Jet Mexico
-Red Wings
-REDjet
-Regional Air Iceland
-Regional Airlines
-Regional Express
-Regional Paraguaya
-Regionalia Chile
-Regionalia México
-Regionalia Uruguay
-Regionalia Venezuela
-Republic Airlines
-Republic Express Airlines
-REXAIR VIRTUEL
-Rossiya
-Rossiya-Russian Airlines
-Rotana Jet
-Royal Air Cambodge
-Royal Air Maroc
-Royal Airways
-Royal Brunei Airlines
-Royal European Airlines
-Royal Falcon
-Royal Flight
-Royal Jordanian
-Royal Nepal Airlines
-Royal Phnom Penh Airways
-RusJet
-Rusline
-Russia State Transport
-Russkie Krylya
-Rwandair Express
-Ryan Air Services
-Ryan International Airlines
-Ryanair
-Régional
-S7 Airlines
-Safi Airlines
-Sahara Airlines
-Salmon Air
-Salsa d\\'Haiti
-Salzburg arrows
-Sama Airlines
-San Dima Air
-Santa Barbara Airlines
-Saratov Aviation Division
-SAS Braathens
-Sat Airlines
-SATA Air Acores
-SATA International
-SATENA
-Saudi Arabian Airlines
-Scandinavian Airlines System
-Scat Air
-Scenic Airlines
-Scoot
-ScotAirways
-Seaborne Airlines
-SeaPort Airlines
-Senegal Airlines
-SENIC AIRLINES
-Serbian Airlines
-Servicios de Transportes A
-Sevenair
-Severstal Air Company
-SGA Airlines
-Shaheen Air International
-Shandong Airlines
-Shanghai Airlines
-Sharp Airlines
-Shenzhen Airlines
-Shuttle America
-Sibaviatrans
-Sichuan Airlines
-Siem Reap Airways
-SilkAir
-Silver Airways (3M)
-Simrik Airlines
-Singapore Airlines
-Singapore Airlines Cargo
-Skagway Air Service
-Sky Airline
-Sky Angkor Airlines (ZA)
-Sky Europe Airlines
-Sky Express
-Sky Regional
-Sky Wing Pacific
-SkyAlps
-SkyBahamas Airlines
-SkyEurope
-Skyjet Airlines
-Skyline Ulasim Ticaret A.S.
-Skymark Airlines
-Skynet Airlines
-Skynet Asia Airways
-Skyservice Airlines
-Skywalk Airlines
-Skyways Express
-Skywest Airlines
-Skywest Australia
-SkyWork Airlines 
-Small Planet Airlines
-SmartLynx Airlines
-Snowbird Airlines
-SOCHI AIR
-SOCHI AIR CHATER
-SOCHI AIR EXPRESS
-Sol Lineas Aereas
-Solar Air
-Solomon Airlines
-South African Airways
-South East Asian Airlines
-South Pacific Island Airways
-Southeast Air
-Southern Air Charter
-Southern Airways
-Southern Airways Express
-Southern Winds Airlines
-Southjet
-Southjet cargo
-Southjet connect
-Southwest Airlines
-Spanair
-SpiceJet
-Spike Airlines
-Spirit Airlines
-Spirit of Manila Airlines
-Spring Airlines
-Spring Airlines Japan
-Sprintair
-SriLankan Airlines
-Sriwijaya Air
-Star Flyer
-Star Peru (2I)
-Star1 Airlines
-Starbow Airlines
-Starline.kz
-Starlux Airlines
-Sterling Airlines
-STP Airways
-Strategic Airlines
-Sudan Airways
-Sun Country Airlines
-Sun D'Or
-SunExpress
-Sunrise Airways
-Sunwing
-Super Air Jet
-SUR Lineas Aereas
-Surinam Airways
-SVG Air
-Svyaz Rossiya
-Swe Fly
-Swiss European Air Lines
-Swiss International Air Lines
-Swissair
-Syrian Arab Airlines
-Syrian Pearl Airlines
-T-way Air
-T.J. Air
-TAAG Angola Airlines
-TACA Peru
-TACV
-Tajik Air
-Tajikistan International Airlines
-TAM Brazilian Airlines
-TAM Mercosur
-TAME
-TAMPA
-TAP Portugal
-Tarom
-Texas Wings
-Tez Jet Airlines
-Thai Air Cargo
-Thai AirAsia
-Thai Airways International
-Thai Lion Air
-Thai Smile Airways
-Thai Vietjet Air
-Thomas Cook Airlines
-Thomsonfly
-Tianjin Airlines
-Tiara Air
-Tiger Airways
-Tiger Airways Australia
-Tom\\'s & co airliners
-Tomp Airlines
-Tomsk-Avia
-Trans Mediterranean Airlines
-Trans Pas Air
-Trans States Airlines
-Transaero Airlines
-Transair
-TransAsia Airways
-Transavia Denmark
-Transavia France
-Transavia Holland
-TransBrasil Airlines
-TransHolding
-TransHolding System
-Transilvania
-Translift Airways
-TransNusa Air
-Transportes Aereos Cielos Andinos
-TransRussiaAirlines
-Transwest Air
-TrasBrasil
-Travel Service
-Trigana Air Service
-TRIP Linhas A
-Tropic Air
-TUIfly
-TUIfly (X3)
-TUIfly Nordic
-Tuninter
-Tunisair
-Turan Air
-Turk Hava Kurumu Hava Taksi Isletmesi
-Turkish Air Force
-Turkish Airlines
-Turkish Wings Domestic
-Turkmenistan Airlines
-Turkuaz Airlines
-Tway Airlines
-Twin Jet
-Tyrolean Airways
-U.S. Air
-Ukraine Atlantic
-Ukraine International Airlines
-UM Airlines
-Uni Air
-United Air Charters
-United Airlines
-United States Air Force
-University of Birmingham Air Squadron (RAF)
-Ural Airlines
-US Airways
-US Helicopter
-US-Bangla Airlines
-Usa Sky Cargo
-USA3000 Airlines
-UTair Aviation
-UTair-Express
-UVT Aero
-Uzbekistan Airways
-V Air
-Valuair
-Varig Log
-Vasco Air
-VASP
-Via Conectia Airlines
-VIA Líneas Aéreas
-ViaAir
-VickJet
-VietJet Air
-Vietnam Airlines
-Viking Hellas
-VIM Airlines
-VIP Ecuador
-Virgin America
-Virgin Atlantic Airways
-Virgin Australia
-Virgin Express
-Virgin Nigeria Airways
-Virgin Pacific
-Virginwings
-Vision Air International
-Vision Airlines (V2)
-Viva Macau
-VivaColombia
-Vladivostok Air
-VLM Airlines
-Voestar
-Volare Airlines
-Volaris
-Volga-Dnepr Airlines
-Volotea
-Volotea Costa Rica
-VRG Linhas Aereas
-Vuela Cuba
-Vueling Airlines
-Vuola Italia
-Wataniya Airways
-Wayraper
-WebJet Linhas A
-Welcome Air
-West Air China
-West Coast Air
-Westair Aviation
-Western Airlines
-Westfalia Express VA
-WestJet
-WestJet Encore
-Whitaker Air
-Whitejets
-Widerøe
-Wilderness Air
-Wind Jet
-Wind Rose Aviation
-Windward Islands Airways
-Wings Air
-Wizz Air
-Wizz Air Hungary
-Wizz Air Ukraine
-World Airways
-World Experience Airline
-World Scale Airlines
-XAIR USA
-Xiamen Airlines
-XiamenAir
-XL Airways France
-XOJET
-Xpressair
-XPTO
-Yamal Airlines
-Yangon Airways
-Yellowstone Club Private Shuttle
-Yellowtail
-Yemenia
-YES Airways
-Yeti Airways
-Yunnan Airlines
-Yuzhmashavia
-ZABAIKAL AIRLINES
-Zabaykalskii Airlines
-Zambezi Airlines (ZMA)
-Zambia Skyways
-Zanair
-Zapolyarie Airlines
-Zenith International Airline
-Zest Air
-Zoom Airlines
-Zz
-Аэросервис
-Катэкавиа
-Псковавиа"""
+    parser = argparse.ArgumentParser(description='Проверка статуса авиакомпаний')
+    parser.add_argument('--refresh', action='store_true',
+                        help='очистить кэш ответов Wikipedia и промежуточное сохранение, проверить все заново')
+    parser.add_argument('--xlsx', action='store_true',
+                        help='дополнительно создать оформленный отчет Excel')
+    args = parser.parse_args()
     
-    airlines_list = [line.strip() for line in airlines.split('\n') if line.strip()]
+    # Список авиакомпаний
+    airlines_list = load_airlines()
     
     print(f"Всего авиакомпаний для проверки: {len(airlines_list)}\n")
     print("="*70)
     
+    # uvloop (Linux/macOS) ускоряет event loop; без него используется стандартный asyncio
+    try:
+        import uvloop
+    except ImportError:
+        pass
+    else:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    
     checker = AirlineChecker()
-    results = []
+    results = asyncio.run(check_all(checker, airlines_list, refresh=args.refresh))
     
-    for idx, airline in enumerate(airlines_list, 1):
-        print(f"\n[{idx}/{len(airlines_list)}] ", end='')
-        result = checker.check_airline(airline)
-        results.append(result)
-        
-        # Задержка между запросами (уменьшена)
-        time.sleep(0.1)
-        
-        # Промежуточное сохранение каждые 100 компаний
-        if idx % 100 == 0:
-            temp_filename = f'airline_status_report_temp_{idx}.xlsx'
-            checker.create_excel_report(results, temp_filename)
-            print(f"\n\nПромежуточное сохранение: {idx} компаний проверено")
+    # Финальное сохранение: CSV всегда, Excel по запросу
+    final_filenames = [checker.write_csv_report(results, 'airline_status_report_final.csv')]
+    if args.xlsx:
+        final_filenames.append(checker.create_excel_report(results, 'airline_status_report_final.xlsx'))
     
-    # Финальное сохранение
-    final_filename = 'airline_status_report_final.xlsx'
-    checker.create_excel_report(results, final_filename)
+    # Все результаты в отчете, промежуточное сохранение больше не нужно
+    CHECKPOINT_FILE.unlink(missing_ok=True)
     
     # Статистика
     print("\n" + "="*70)
@@ -1481,7 +642,7 @@ Zz
     print(f"Высокая уверенность: {sum(1 for r in results if r['confidence'] == 'ВЫСОКИЙ')}")
     print(f"Средняя уверенность: {sum(1 for r in results if r['confidence'] == 'СРЕДНИЙ')}")
     print(f"Низкая уверенность: {sum(1 for r in results if r['confidence'] == 'НИЗКИЙ')}")
-    print(f"\nИтоговый отчет: {final_filename}")
+    print(f"\nИтоговый отчет: {', '.join(final_filenames)}")
     print("="*70)
 
 if __name__ == "__main__":